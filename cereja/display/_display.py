@@ -19,23 +19,25 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import functools
 import io
+import math
 import os
+import re
 import threading
 import time
 import sys
 import random
+from collections import deque
 from typing import Tuple, Callable
-from abc import ABCMeta as ABC
 from typing import List
-from abc import ABCMeta, abstractmethod
 from typing import Sequence, Any, Union, AnyStr
 
 from cereja import has_length
 from cereja.utils import is_iterable
 from cereja.config.cj_types import Number
 from cereja.system.unicode import Unicode
-from cereja.utils import fill, get_instances_of, import_string
+from cereja.utils import get_instances_of, import_string
 from cereja.utils.time import time_format
 from cereja.mathtools import proportional, estimate, percent
 
@@ -72,6 +74,107 @@ _STDOUT_ORIGINAL_COPY = sys.stdout
 _STDERR_ORIGINAL_COPY = sys.stderr
 
 
+@functools.lru_cache(maxsize=4096)
+def _time_format_seconds(seconds: int) -> str:
+    return time_format(seconds)
+
+
+def _time_format(seconds: Number):
+    """
+    `time_format` memoized on whole seconds, that is the resolution it displays.
+    Negative and NaN values are formatted as is.
+    """
+    if seconds >= 0:
+        return _time_format_seconds(int(seconds))
+    return time_format(seconds)
+
+
+def _is_interactive() -> bool:
+    """
+    Checks if the console can animate the progress (rewrite the last line).
+    When stdout is redirected to a file or pipe only the final state is useful.
+    """
+    if JUPYTER or os.environ.get("PYCHARM_HOSTED"):
+        return True
+    try:
+        return _STDOUT_ORIGINAL_COPY.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class _NonBmpMap:
+    """
+    Translation table for `str.translate` that replaces non-BMP code points with U+FFFD.
+    Avoids building a dict with a key for each of the ~1M non-BMP code points.
+    """
+
+    def __getitem__(self, codepoint: int) -> int:
+        if codepoint > 0xFFFF:
+            return 0xFFFD
+        raise LookupError(codepoint)
+
+
+class _ChunkBuffer(io.TextIOBase):
+    """
+    Text stream used to capture sys.stdout/sys.stderr while the console is persisting.
+    Writes are only appended and `drain` consumes them, so there is no seek/truncate reallocation.
+    `on_line` is set whenever a complete line is buffered.
+    """
+
+    def __init__(self, on_line: threading.Event = None):
+        super().__init__()
+        self._chunks = deque()
+        self._on_line = on_line
+
+    def writable(self):
+        return True
+
+    def write(self, s: str) -> int:
+        self._chunks.append(s)
+        if self._on_line is not None and "\n" in s:
+            self._on_line.set()
+        return len(s)
+
+    def has_data(self) -> bool:
+        # not __bool__, the buffer takes the place of sys.stdout and a stream is always truthy
+        return bool(self._chunks)
+
+    def drain(self) -> str:
+        chunks = self._chunks
+        values = []
+        while chunks:
+            values.append(chunks.popleft())
+        return "".join(values)
+
+
+class _LazyRedirect:
+    """
+    Replaces sys.stdout/sys.stderr while the console is persisting.
+    The capture buffer and its consumer thread are only set up on the first write, so a progress
+    without user prints never starts them. Attributes other than write are taken from the original stream.
+    """
+
+    def __init__(self, original, get_target: Callable[[], Any], is_persisting: Callable[[], bool]):
+        self._original = original
+        self._get_target = get_target
+        self._is_persisting = is_persisting
+
+    def write(self, s: str) -> int:
+        return self._get_target().write(s)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        # captured writes are flushed by the console, only the original stream needs it
+        if not self._is_persisting():
+            self._original.flush()
+
+    def __getattr__(self, item):
+        return getattr(self._original, item)
+
+
 class _Stdout:
     __user_msg = []
     _stdout_original = _STDOUT_ORIGINAL_COPY
@@ -82,8 +185,21 @@ class _Stdout:
         self.th_console = None
         self.last_console_msg = ""
         self.use_th_console = False
-        self._stdout_buffer = io.StringIO()
-        self._stderr_buffer = io.StringIO()
+        self._buf_event = threading.Event()
+        self._capture_lock = threading.Lock()
+        # keeps the redirects alive: print() only borrows sys.stdout while writing
+        self._stdout_redirect = _LazyRedirect(
+                self._stdout_original,
+                lambda: self._capture_target(self._stdout_buffer, self._stdout_original),
+                lambda: self.persisting,
+        )
+        self._stderr_redirect = _LazyRedirect(
+                self._stderr_original,
+                lambda: self._capture_target(self._stderr_buffer, self._stderr_original),
+                lambda: self.persisting,
+        )
+        self._stdout_buffer = _ChunkBuffer(self._buf_event)
+        self._stderr_buffer = _ChunkBuffer(self._buf_event)
         self.console = console_
 
     @classmethod
@@ -103,24 +219,15 @@ class _Stdout:
         self.__user_msg = msg
 
     def _has_user_msg(self):
-        if self._stdout_buffer.getvalue():
-            return True
-        else:
-            return False
+        return self._stdout_buffer.has_data() or self._stderr_buffer.has_data()
 
     @property
     def stdout_buffer_values(self):
-        vals = self._stdout_buffer.getvalue()
-        self._stdout_buffer.seek(0)
-        self._stdout_buffer.truncate()
-        return vals
+        return self._stdout_buffer.drain()
 
     @property
     def stderr_buffer_values(self):
-        vals = self._stderr_buffer.getvalue()
-        self._stderr_buffer.seek(0)
-        self._stderr_buffer.truncate()
-        return vals
+        return self._stderr_buffer.drain()
 
     def write_user_msg(self):
         stdout, stderr = self.stdout_buffer_values, self.stderr_buffer_values
@@ -145,8 +252,10 @@ class _Stdout:
 
     def _write_user_msg_loop(self):
         while self.use_th_console:
+            # wakes up as soon as a line is written; the timeout flushes pending partial lines
+            self._buf_event.wait(timeout=1.0)
+            self._buf_event.clear()
             self.write_user_msg()
-            time.sleep(0.1)
         if self._has_user_msg():
             self.write_user_msg()
 
@@ -156,19 +265,19 @@ class _Stdout:
             if msg.strip(" ") == "":
                 return
             self._stdout_original.write(msg)
-            self._stdout_original.flush()
         except (UnicodeError, UnicodeEncodeError):
             msg = self.console.translate_non_bmp(msg)
             self._stdout_original.write(msg.encode("ascii", errors="replace").decode())
-            self._stdout_original.flush()
+        self._stdout_original.flush()
 
     def cj_msg(self, msg: str, line_sep=None, replace_last=False):
         self.last_console_msg = msg
         if replace_last:
             msg = f"\r{msg}"
-        self._write(msg)
         if line_sep is not None:
-            self._write(line_sep)
+            # one write (and flush) per frame
+            msg = f"{msg}{line_sep}"
+        self._write(msg)
 
     def __del__(self):
         self.restore_sys_module_state()
@@ -180,22 +289,38 @@ class _Stdout:
     def flush(self):
         self._stdout_original.flush()
 
+    def _capture_target(self, buffer, original):
+        with self._capture_lock:
+            if not self.persisting:
+                # e.g: a reference to sys.stdout kept after disable
+                return original
+            if not self.use_th_console:
+                self.use_th_console = True
+                self.th_console = threading.Thread(
+                        name="Console", target=self._write_user_msg_loop
+                )
+                self.th_console.start()
+                if sys.stdout is self._stdout_redirect:
+                    sys.stdout = self._stdout_buffer
+                if sys.stderr is self._stderr_redirect:
+                    sys.stderr = self._stderr_buffer
+        return buffer
+
     def persist(self):
         if not self.persisting:
-            self.use_th_console = True
-            self.th_console = threading.Thread(
-                    name="Console", target=self._write_user_msg_loop
-            )
-            self.th_console.start()
-            sys.stdout = self._stdout_buffer
-            sys.stderr = self._stderr_buffer
             self.persisting = True
+            sys.stdout = self._stdout_redirect
+            sys.stderr = self._stderr_redirect
 
     def disable(self):
-        if self.use_th_console:
+        with self._capture_lock:
+            was_persisting, self.persisting = self.persisting, False
+            th_console = self.th_console if self.use_th_console else None
             self.use_th_console = False
-            self.th_console.join()
-            self.persisting = False
+        if th_console is not None:
+            self._buf_event.set()
+            th_console.join()
+        if was_persisting:
             self.console.set_prefix(_LOGIN_NAME)
         self.restore_sys_module_state()
 
@@ -208,9 +333,9 @@ class _Stdout:
             sys.stderr = _STDERR_ORIGINAL_COPY
 
 
-class _ConsoleBase(metaclass=ABC):
+class _ConsoleBase:
     _instance = None
-    NON_BMP_MAP = dict.fromkeys(range(0x10000, sys.maxunicode + 1), 0xFFFD)
+    NON_BMP_MAP = _NonBmpMap()
     DONE_UNICODE = "\U00002705"
     ERROR_UNICODE = "\U0000274C"
     CHERRY_UNICODE = "\U0001F352"
@@ -241,6 +366,8 @@ class _ConsoleBase(metaclass=ABC):
         "white":   CL_WHITE,
         "default": __CL_DEFAULT,
     }
+    # single pass over the template tokens, e.g: {red}, {endred}
+    _TOKEN_RE = re.compile(r"\{(end)?(%s)\}" % "|".join(__color_map))
 
     MAX_SPACE = 20
     MAX_BLOCKS = 5
@@ -250,6 +377,10 @@ class _ConsoleBase(metaclass=ABC):
 
     def __init__(self, color_text: str = "default"):
         self.__color_map = self._color_map  # get copy
+        # wraps the class function, __init__ runs again on each _ConsoleBase() of this singleton
+        self._normalize_format = functools.lru_cache(maxsize=256)(type(self)._normalize_format.__get__(self))
+        self._title_prefix = functools.lru_cache(maxsize=128)(type(self)._title_prefix.__get__(self))
+        self._color_keys = tuple(self.__color_map)
         self.text_color = color_text
         self._stdout = _Stdout(self)
 
@@ -292,14 +423,18 @@ class _ConsoleBase(metaclass=ABC):
             raise ValueError(f"Color not found.")
         self.__color_map["default"] = self.__color_map[color]
         self.__text_color = self.__color_map[color]
+        self._normalize_format.cache_clear()  # cached values depend on default color
 
     def __bg(self, text_, color):
         return f"\33[48;5;{color}m{text_}{self.__text_color}"
 
+    def _title_prefix(self, title):
+        return f"{self.__msg_prefix} {title} {self.__right_point}"
+
     def _msg_prefix(self, title=None):
         if title is None:
             title = self.prefix_name
-        return f"{self.__msg_prefix} {title} {self.__right_point}"
+        return self._title_prefix(title)
 
     def translate_non_bmp(self, msg: str):
         """
@@ -323,12 +458,15 @@ class _ConsoleBase(metaclass=ABC):
     def _write(self, msg, line_sep=None):
         self._stdout.cj_msg(msg, line_sep)
 
+    def _token_sub(self, match):
+        if match.group(1):
+            return self.__color_map["default"]
+        return self.__color_map[match.group(2)]
+
     def _normalize_format(self, s):
-        for color_name in self.__color_map:
-            s = s.replace("{end%s}" % color_name, self.__color_map["default"])
-            s = s.replace("{%s}" % color_name, self.__color_map[color_name])
-        s = s.replace("  ", " ") + self.__color_map["default"]
-        return s
+        if "{" in s:
+            s = self._TOKEN_RE.sub(self._token_sub, s)
+        return s.replace("  ", " ") + self.__color_map["default"]
 
     def parse(self, msg, title=None):
         return self._parse(msg, title)
@@ -350,10 +488,10 @@ class _ConsoleBase(metaclass=ABC):
                     f" [red, green, yellow, blue, magenta and cyan]."
             )
         s = self._normalize_format(s)
-        return f"{self._color_map[color]}{s}{self._color_map['default']}"
+        return f"{self.__color_map[color]}{s}{self.__color_map['default']}"
 
     def random_color(self, text: str):
-        color = random.choice(list(self.__color_map))
+        color = random.choice(self._color_keys)
         template_format = f'{{{color}}}{text}{{{"end" + color}}}'
         return self.template_format(template_format)
 
@@ -413,22 +551,26 @@ class _ConsoleBase(metaclass=ABC):
 
 console = _ConsoleBase()
 
+_DOUBLE_BLANKS = tuple("  " * i for i in range(64))
 
-class State(metaclass=ABCMeta):
+
+class State:
+    __slots__ = ()
     size = 10
 
     def __repr__(self):
         return f"{self.name} {self.done(100, 100, 100, 0, 100)}"
 
     def blanks(self, current_size):
-        blanks = "  " * (self.size - current_size - 1)
-        return blanks
+        n = self.size - current_size - 1
+        if n < 0:
+            return ""
+        return _DOUBLE_BLANKS[n] if n < len(_DOUBLE_BLANKS) else "  " * n
 
     @property
     def name(self):
         return f"{self.__class__.__name__.replace('__State', '')} field"
 
-    @abstractmethod
     def display(
             self,
             current_value: Number,
@@ -439,9 +581,10 @@ class State(metaclass=ABCMeta):
     ) -> str:
         """
         This function is always being called.
+        Custom states receive the values as keyword arguments, so they can take only some of them by **kwargs.
         :return: You need to return a string with the status of your progress
         """
-        pass
+        raise NotImplementedError
 
     def done(
             self,
@@ -473,6 +616,16 @@ class _StateLoading(State):
     left_right_delimiter = "[]"
     default_char = "."
     size = 3
+    __slots__ = ("_frames", "_done_frame")
+
+    def __init__(self):
+        l_delimiter, r_delimiter = self.left_right_delimiter
+        # the animation has only `size` frames
+        self._frames = tuple(
+                f"{l_delimiter}{''.join(self.sequence[: idx + 1]).ljust(self.size)}{r_delimiter}"
+                for idx in range(self.size)
+        )
+        self._done_frame = f"{l_delimiter}{self.default_char * self.size}{r_delimiter}"
 
     def display(
             self,
@@ -483,11 +636,7 @@ class _StateLoading(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        idx = n_times % self.size
-        value = "".join(self.sequence[: idx + 1])
-        filled = fill(value, self.size, with_=" ")
-        l_delimiter, r_delimiter = self.left_right_delimiter
-        return f"{l_delimiter}{filled}{r_delimiter}"
+        return self._frames[n_times % self.size]
 
     def done(
             self,
@@ -498,13 +647,17 @@ class _StateLoading(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        l_delimiter, r_delimiter = self.left_right_delimiter
-        return f"{l_delimiter}{self.default_char * self.size}{r_delimiter}"
+        return self._done_frame
 
 
 class _StateAwaiting(_StateLoading):
-    def _clean(self, result):
-        return result.strip(self.left_right_delimiter)
+    __slots__ = ("_awaiting_frames", "_processing_frames")
+
+    def __init__(self):
+        super().__init__()
+        dots = tuple(frame.strip(self.left_right_delimiter) for frame in self._frames)
+        self._awaiting_frames = tuple(f"Awaiting{value}" for value in dots)
+        self._processing_frames = tuple(f"Processing{value}" for value in dots)
 
     def display(
             self,
@@ -515,18 +668,10 @@ class _StateAwaiting(_StateLoading):
             n_times: int,
             **kwargs,
     ) -> str:
-        result = self._clean(
-                super().display(
-                        current_value=current_value,
-                        max_value=max_value,
-                        current_percent=current_percent,
-                        time_it=time_it,
-                        n_times=n_times,
-                )
-        )
+        idx = n_times % self.size
         if kwargs.get("is_generator"):
-            return f"{time_format(time_it)} - Total: {current_value} - Processing{result}"
-        return f"{time_format(time_it)} - Awaiting{result}"
+            return f"{_time_format(time_it)} - Total: {current_value} - {self._processing_frames[idx]}"
+        return f"{_time_format(time_it)} - {self._awaiting_frames[idx]}"
 
     def done(
             self,
@@ -537,10 +682,11 @@ class _StateAwaiting(_StateLoading):
             n_times: int,
             **kwargs,
     ) -> str:
-        return f"Total Time: {time_format(time_it)}"
+        return f"Total Time: {_time_format(time_it)}"
 
 
 class _StateDownloadData(State):
+    __slots__ = ()
     _size_map = {"B": 1.0e0, "KB": 1.0e3, "MB": 1.0e6, "GB": 1.0e9, "TB": 1.0e12}
 
     def display(
@@ -564,12 +710,21 @@ class _StateBar(State):
     default_char = "="
     blank = " "
     size = 30
+    # no __slots__, the class level arrow/default_char/blank/size stay overridable per instance
 
     def __init__(self):
+        arrow, default_char, blank = self.arrow, self.default_char, self.blank
         if console.non_bmp_supported:
-            self.arrow = ""
-            self.default_char = "▰"
-            self.blank = "▱"
+            arrow, default_char, blank = "", "▰", "▱"
+        self._l_delimiter, self._r_delimiter = self.left_right_delimiter
+        self._done_template = f"{{green}}{default_char * self.size}{{endgreen}}"
+        # the bar has only `size + 1` possible states
+        self._bar_templates = tuple(
+                f"{{green}}{default_char * i}{arrow}{{endgreen}}" for i in range(self.size + 1)
+        )
+        self._bar_blanks = tuple(blank * (self.size - i - 1) for i in range(self.size + 1))
+        self._cache = {}  # bar index -> rendered bar
+        self._cache_color = None
 
     def display(
             self,
@@ -580,14 +735,17 @@ class _StateBar(State):
             n_times: int,
             **kwargs,
     ) -> AnyStr:
-        l_delimiter, r_delimiter = self.left_right_delimiter
-        prop_max_size = int(proportional(current_value, max_value, self.size))
-        blanks = self.blank * (self.size - prop_max_size - 1)
-        body = console.template_format(
-                f"{{green}}{self.default_char * prop_max_size}{self.arrow}{{endgreen}}"
-        )
-        # value = f"{current_value:0{len(str(max_value))}d}/{max_value}"
-        return f"{l_delimiter}{body}{blanks}{r_delimiter}"
+        idx = min(max(int(proportional(current_value, max_value, self.size)), 0), self.size)
+        if self._cache_color != console.text_color:
+            # rendered bars depend on the console default color
+            self._cache.clear()
+            self._cache_color = console.text_color
+        bar = self._cache.get(idx)
+        if bar is None:
+            body = console.template_format(self._bar_templates[idx])
+            # value = f"{current_value:0{len(str(max_value))}d}/{max_value}"
+            bar = self._cache[idx] = f"{self._l_delimiter}{body}{self._bar_blanks[idx]}{self._r_delimiter}"
+        return bar
 
     def done(
             self,
@@ -598,15 +756,18 @@ class _StateBar(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        l_delimiter, r_delimiter = self.left_right_delimiter
-        body = console.template_format(
-                f"{{green}}{self.default_char * self.size}{{endgreen}}"
-        )
-        return f"{l_delimiter}{body}{r_delimiter}"
+        body = console.template_format(self._done_template)
+        return f"{self._l_delimiter}{body}{self._r_delimiter}"
 
 
 class _StatePercent(State):
     size = 8
+    _done_value = f"{100:06.2f}%"
+    __slots__ = ("_cache",)
+
+    def __init__(self):
+        # current_percent is rounded to 2 digits, so there are at most 10001 distinct values in [0, 100]
+        self._cache = {}
 
     def display(
             self,
@@ -617,7 +778,14 @@ class _StatePercent(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        return f"{current_percent:.2f}%"
+        value = self._cache.get(current_percent)
+        if value is None:
+            # zero padded to the width of the done value, e.g: 005.25%
+            value = f"{current_percent:06.2f}%"
+            if 0 <= current_percent <= 100:
+                # values past max_value aren't cached, they are unbounded
+                self._cache[current_percent] = value
+        return value
 
     def done(
             self,
@@ -628,7 +796,7 @@ class _StatePercent(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        return f"{100:.2f}%"
+        return self._done_value
 
 
 class _StateTime(State):
@@ -636,6 +804,14 @@ class _StateTime(State):
     __max_sequence = 12
     size = 11
 
+    __estimate_interval = 0.25  # seconds of time_it between estimate updates
+    __slots__ = ("_clock_frames", "_estimate_at", "_estimate")
+
+    def __init__(self):
+        self._clock_frames = tuple(str(self.__clock + idx) for idx in range(self.__max_sequence + 1))
+        self._estimate_at = None
+        self._estimate = None
+
     def display(
             self,
             current_value: Number,
@@ -645,14 +821,18 @@ class _StateTime(State):
             n_times: int,
             **kwargs,
     ) -> str:
-        time_estimate = estimate(
-                current_value - kwargs.get("started_on", 0),
-                max_value - kwargs.get("started_on", 0),
-                time_it,
-        )
-        idx = int(proportional(current_value, max_value, self.__max_sequence))
-        t_format = f"{time_format(time_estimate)}"
-        value = f"{self.__clock + idx} {time_format(time_it)}/{t_format}"
+        if self._estimate_at is None or not 0 <= time_it - self._estimate_at < self.__estimate_interval:
+            seconds = estimate(
+                    current_value - kwargs.get("started_on", 0),
+                    max_value - kwargs.get("started_on", 0),
+                    time_it,
+            )
+            self._estimate = _time_format(seconds)
+            # NaN means nothing was done yet, it is recomputed on the next frame
+            self._estimate_at = None if math.isnan(seconds) else time_it
+        idx = min(max(int(proportional(current_value, max_value, self.__max_sequence)), 0), self.__max_sequence)
+        t_format = f"{self._estimate}"
+        value = f"{self._clock_frames[idx]} {_time_format(time_it)}/{t_format}"
         return f"{value}{self.blanks(len(value))} estimated"
 
     def done(
@@ -664,10 +844,11 @@ class _StateTime(State):
             n_times: float,
             **kwargs,
     ) -> str:
-        return f"{self.__clock} {time_format(time_it)} total"
+        return f"{self._clock_frames[0]} {_time_format(time_it)} total"
 
 
 class _StateValue(State):
+    __slots__ = ()
     _update_size = False
     _mask = "%.d"
 
@@ -707,6 +888,7 @@ class Progress:
 
     __awaiting_state = _StateAwaiting()
     __done_unicode = Unicode("\U00002705")
+    __done_text = f"Done! {__done_unicode}"
     __err_unicode = Unicode("\U0000274C")
     __key_map = {
         "loading":  _StateLoading,
@@ -716,10 +898,17 @@ class Progress:
         "value":    _StateValue,
         "download": _StateDownloadData,
     }
-    _with_context = False
-    __built = False
+    # called positionally, other states receive keyword arguments
+    __builtin_states = frozenset(__key_map.values())
+    _draw_interval = 1 / 30  # seconds, bounds the redraw rate (~30 fps)
     _console = console
     _progresses = {}
+    __slots__ = (
+        "_is_generator", "_n_times", "_name", "_task_count", "_started", "_awaiting_update", "_iter_finaly", "_show",
+        "_custom_state_value", "_custom_state_name", "_started_time", "_states", "_display_fns", "_done_fns",
+        "_max_value", "_current_value", "_th_root", "_is_tty", "_stop_event", "_last_frame", "_final_drawn",
+        "_was_done", "_err", "_with_context", "__built", "sequence", "__weakref__",
+    )
 
     def __init__(
             self,
@@ -730,6 +919,8 @@ class Progress:
             custom_state_func=None,
             custom_state_name=None,
     ):
+        self.__built = False
+        self._with_context = False
         self._is_generator = False
         self._n_times = 0
         self._name = name or "Progress"
@@ -745,11 +936,17 @@ class Progress:
             custom_state_name if custom_state_name else "Custom State"
         )
         self._started_time = None
-        self._states = ()
+        self._states = []
+        self._display_fns = ()
+        self._done_fns = ()
         self.add_state(states)
         self._max_value = max_value
         self._current_value = 0
         self._th_root = self._create_progress_service()
+        self._is_tty = _is_interactive()
+        self._stop_event = threading.Event()  # interrupts the service waits on stop
+        self._last_frame = None
+        self._final_drawn = False
         self._was_done = False
         self._err = False
         self.__built = True
@@ -800,24 +997,22 @@ class Progress:
             progress.stop()
 
     def _parse_states(self):
-        return tuple(map(lambda stt: stt.__class__.__name__, self._states))
+        return tuple(stt.__class__.__name__ for stt in self._states)
 
-    def _get_done_state(self, **kwargs):
+    def _get_done_state(self, *args):
         if self._current_value == 0:
-            result = [self.__awaiting_state.done(**kwargs)]
+            result = [self.__awaiting_state.done(*args)]
         else:
-            result = list(map(lambda state: state.done(**kwargs), self._states))
-        done_msg = f"Done! {self.__done_unicode}"
-        done_msg = self._console.format(done_msg, "green")
-        result.append(done_msg)
+            result = [done(*args) for done in self._done_fns]
         return result
 
-    def _get_state(self, **kwargs):
-        return list(map(lambda state: state.display(**kwargs), self._states))
+    def _get_state(self, *args):
+        return [display(*args) for display in self._display_fns]
 
     @property
     def time_it(self):
-        return time.time() - (self._started_time or time.time())
+        # monotonic, a wall clock adjustment can't make the elapsed time negative
+        return time.monotonic() - self._started_time if self._started_time is not None else 0.0
 
     @property
     def total_completed(self):
@@ -831,39 +1026,59 @@ class Progress:
         :return: current state and bool if is done else False
         """
         self._n_times += 1
-        kwargs = {
-            "current_value":   for_value,
-            "max_value":       self.max_value,
-            "current_percent": self.percent_(for_value),
-            "time_it":         self.time_it,
-            "n_times":         self._n_times,
-        }
+        max_value = self.max_value
+        # same order as State.display: current_value, max_value, current_percent, time_it, n_times
+        args = (for_value, max_value, self._percent(for_value, max_value), self.time_it, self._n_times)
         extra_ = (
             f" - {self._custom_state_name}: {self._custom_state_value()}"
             if self._custom_state_value
             else ""
         )
         if self._was_done:
-            return " - ".join(self._get_done_state(**kwargs)) + extra_
+            done_msg = self._console.format(self.__done_text, "green")
+            return f"{' - '.join(self._get_done_state(*args))} - {done_msg}{extra_}"
         else:
-            _state_msg = " - ".join(self._get_state(**kwargs)) + extra_
+            _state_msg = " - ".join(self._get_state(*args)) + extra_
             if self._err:
                 error_msg = f"Interrupted!"
                 error_msg = self._console.format(error_msg, "red")
                 _state_msg = f"{_state_msg} {error_msg}"
             elif self._iter_finaly:
-                finish_msg = f"Done! {self.__done_unicode}"
-                finish_msg = self._console.format(finish_msg, "green")
+                finish_msg = self._console.format(self.__done_text, "green")
                 _state_msg = f"{_state_msg} {finish_msg}"
             return _state_msg
 
+    @staticmethod
+    def _keyword_call(method):
+        # user states may take the arguments in any order or only some of them by **kwargs
+        def call(current_value, max_value, current_percent, time_it, n_times):
+            return method(
+                    current_value=current_value,
+                    max_value=max_value,
+                    current_percent=current_percent,
+                    time_it=time_it,
+                    n_times=n_times,
+            )
+
+        return call
+
+    def _state_fns(self, state):
+        if type(state) in self.__builtin_states:
+            return state.display, state.done
+        return self._keyword_call(state.display), self._keyword_call(state.done)
+
+    def _refresh_state_fns(self):
+        # bound methods called on every tick, rebuilt whenever the states change
+        fns = [self._state_fns(state) for state in self._states]
+        self._display_fns = tuple(display for display, _ in fns)
+        self._done_fns = tuple(done for _, done in fns)
+
     def add_state(self, state: Union[State, Sequence[State]], idx=-1):
         self._filter_and_add_state(state, idx)
 
     def remove_state(self, idx):
-        states = list(self._states)
-        states.pop(idx)
-        self._states = tuple(states)
+        self._states.pop(idx)
+        self._refresh_state_fns()
 
     def _parse_state(self, state):
         if isinstance(state, str):
@@ -884,15 +1099,16 @@ class Progress:
 
     def _filter_and_add_state(self, state: Union[State, Sequence[State]], index_=-1):
         state = self._valid_states(state)
-        filtered = tuple(filter(lambda stt: stt not in self._states, tuple(state)))
-        if any(filtered):
+        existing = set(map(id, self._states))
+        # _valid_states returns (None,) for no states
+        filtered = tuple(stt for stt in state if stt is not None and id(stt) not in existing)
+        if filtered:
             if index_ == -1:
-                self._states += filtered
+                self._states.extend(filtered)
             else:
-                states = list(self._states)
                 for idx, new_state in enumerate(filtered):
-                    states.insert(index_ + idx, new_state)
-                self._states = tuple(states)
+                    self._states.insert(index_ + idx, new_state)
+            self._refresh_state_fns()
             if self.__built:
                 self._console.log(f"Added new states! {filtered}")
 
@@ -900,8 +1116,15 @@ class Progress:
     def states(self):
         return self._parse_states()
 
+    @staticmethod
+    def _percent(for_value: Number, max_value: Number) -> Number:
+        if max_value == 100:
+            # the value is already a percentage
+            return round(float(for_value), 2)
+        return percent(for_value, max_value)
+
     def percent_(self, for_value: Number) -> Number:
-        return percent(for_value, self.max_value)
+        return self._percent(for_value, self.max_value)
 
     def update_max_value(self, max_value: int):
         """
@@ -923,23 +1146,38 @@ class Progress:
                     not self._show and not self._was_done
             ):
                 n_times += 1
+                self._last_frame = None
                 self._console.replace_last_msg(
                         self.__awaiting_state.display(
                                 self._current_value, 0, 0, time_it=self.time_it, n_times=n_times, is_generator=self._is_generator
                         )
                 )
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
+                if not self._started or self._iter_finaly:
+                    break  # the final frame is written by whoever finished the loop
             if not self._awaiting_update or (self._show and self._max_value is not None):
                 self._show_progress(self._current_value)
             last_value = self._current_value
-            time.sleep(0.01)
+            self._stop_event.wait(self._draw_interval)
 
     def _show_progress(self, for_value=None):
         self._awaiting_update = False
+        if self._iter_finaly:
+            self._show_final_progress()
+            return
         build_progress = self._states_view(for_value or self._current_value)
-        self._console.replace_last_msg(
-                build_progress, end="\n" if self._iter_finaly else None
-        )
+        if build_progress == self._last_frame:
+            return  # already on the screen
+        self._last_frame = build_progress
+        self._console.replace_last_msg(build_progress)
+
+    def _show_final_progress(self):
+        # writes the last value once, ending the line
+        if self._final_drawn:
+            return
+        self._final_drawn = True
+        self._last_frame = None
+        self._console.replace_last_msg(self._states_view(self._current_value), end="\n")
 
     def _update_value(self, value):
         self._awaiting_update = self._is_generator  # if is generator awaiting state is default.
@@ -964,13 +1202,21 @@ class Progress:
         self._current_value = 0
         self._n_times = 0
         self._started_time = None
+        self._last_frame = None
 
     def start(self):
         self._console.set_prefix(self._name)
         if self._started:
             return
-        self._started_time = time.time()
+        self._started_time = time.monotonic()
         self._started = True
+        self._stop_event.clear()
+        self._last_frame = None
+        self._final_drawn = False
+        if not self._is_tty:
+            # nothing to animate, only the final state will be written.
+            self._n_times = 0
+            return
         try:
             self._th_root.start()
         except:
@@ -984,7 +1230,12 @@ class Progress:
         if self._started:
             self._awaiting_update = False
             self._started = False
-            self._th_root.join()
+            self._stop_event.set()
+            if self._th_root.is_alive():
+                self._th_root.join()
+            if self._show:
+                # the service may have stopped before drawing the last value
+                self._show_final_progress()
             self._console.disable()
         if id(self) in Progress._progresses:
             # TODO: verify if this works
@@ -1025,6 +1276,8 @@ class Progress:
                 slice_ = self._states.index(key)
             else:
                 raise KeyError(f"Not exists {key}")
+        if isinstance(slice_, slice):
+            return tuple(self._states[slice_])
         return self._states[slice_]
 
     def __call__(self, sequence: Sequence, name=None, max_value=None) -> "Progress":
@@ -1041,17 +1294,39 @@ class Progress:
             self._console.set_prefix(f"{self.name}({name})")
         if self._with_context and name is None:
             self._console.set_prefix(f"{self.name}(iter-{self._task_count})")
-        self._started_time = time.time()
+        self._started_time = time.monotonic()
         self._task_count += 1
         return self
 
-    def __next__(self):
+    def _new_iteration(self):
+        """
+        Resets the state left by a previous pass, e.g: many loops on the same `with` block or instance.
+        """
+        if not self._iter_finaly:
+            return
+        self._iter_finaly = False
+        self._was_done = False
+        self._err = False
+        self._show = False
+        self._awaiting_update = True
+        self._current_value = 0
+        self._n_times = 0
+        self._last_frame = None
+        self._final_drawn = False
+        if self._started and self._is_tty and not self._th_root.is_alive():
+            # the progress service ends with the pass
+            self._th_root = self._create_progress_service()
+            self._th_root.start()
+
+    def __iter__(self):
         original_name = self._name
+        self._new_iteration()
         if not self._with_context:
             self.start()
+        update_value = self._update_value
         try:
-            for n, obj in enumerate(self.sequence):
-                self._update_value(n + 1)
+            for n, obj in enumerate(self.sequence, 1):
+                update_value(n)
                 yield obj
         except:
             self._err = True
@@ -1059,25 +1334,21 @@ class Progress:
             if self._is_generator:
                 self.update_max_value(self._current_value)
             self._was_done = (self._current_value >= self.max_value) and not self._err
+            self._iter_finaly = True
             if not self._with_context:
                 self.stop()
-            self._iter_finaly = True
-            self._show_progress(self._current_value)
+            self._show_final_progress()
 
         self._console.set_prefix(original_name)
         self.sequence = ()
 
-    def __iter__(self):
-        return self.__next__()
-
     def __setitem__(self, key, value):
         value = self._valid_states(value)[0]
         if isinstance(value, State):
             value = value
             if isinstance(key, int):
-                states_ = list(self._states)
-                states_[key] = value
-                self._states = tuple(states_)
+                self._states[key] = value
+                self._refresh_state_fns()
         else:
             raise ValueError("Please send State object")
 
@@ -1,3 +1,9 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
 from .._requests import request
 from ..hashtools import base64_encode
 from ..utils import get_zero_mask
@@ -11,6 +17,13 @@ STOCK_EXCHANGES_CONFIG = {
            "financial_endpoint":   "GetListedFinancial",
            }
 }
+_STRIP_DIGITS = str.maketrans("", "", "0123456789")
+
+# url -> (timestamp, response json); B3 data doesn't change often for the same query
+_RESPONSE_CACHE_TTL = 300
+_RESPONSE_CACHE_MAX_SIZE = 1024
+_response_cache = {}
+_response_cache_lock = threading.Lock()
 
 
 class StockExchangeConfig:
@@ -28,14 +41,40 @@ class StockExchangeConfig:
 
     def get_config(self, exchange):
         # Returns config for a specific stock exchange
-        return self.config.get(exchange.upper())
+        return _get_config(exchange)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_config(exchange: str) -> dict:
+    # Memoized config lookup; prefer it over StockExchangeConfig
+    return STOCK_EXCHANGES_CONFIG.get(exchange.upper())
+
+
+def _cached_get(url_parsed, timeout=30) -> dict:
+    # Only successful responses are cached, each for _RESPONSE_CACHE_TTL seconds
+    now = time.time()
+    with _response_cache_lock:
+        cached = _response_cache.get(url_parsed)
+    if cached is not None and now - cached[0] < _RESPONSE_CACHE_TTL:
+        return cached[1]
+    response = request.get(url_parsed, timeout=timeout)
+    if response.code != 200:
+        raise ConnectionRefusedError(response.data)
+    data = response.json()
+    with _response_cache_lock:
+        _response_cache.pop(url_parsed, None)
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX_SIZE:
+            # drops the oldest entry
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[url_parsed] = (now, data)
+    return data
 
 
 class Share:
     def __init__(self, trading_code, exchange="B3", language="pt-br"):
         self.trading_code = trading_code.upper()
         self.language = language
-        self.config = StockExchangeConfig().get_config(exchange)
+        self.config = _get_config(exchange)
         self._head_lines = None
         self._financial = None
 
@@ -44,19 +83,35 @@ class Share:
 
         self._get_share_info()
 
+    @classmethod
+    def from_trading_codes(cls, trading_codes: Iterable[str], exchange="B3", language="pt-br",
+                           max_workers=8) -> List["Share"]:
+        # Each Share is an independent, network-bound request, so they are built concurrently
+        trading_codes = list(trading_codes)
+        if not trading_codes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(trading_codes))) as executor:
+            return list(executor.map(lambda code: cls(code, exchange=exchange, language=language), trading_codes))
+
+    @staticmethod
+    def clear_cache():
+        # Drops the cached API responses, the next requests go to the network
+        with _response_cache_lock:
+            _response_cache.clear()
+
+    def _url(self, endpoint_key: str, query: dict) -> str:
+        # The API receives the query base64 encoded as the last path segment
+        return f"{self.config['base_api_url']}/{self.config[endpoint_key]}/{base64_encode(query).decode('ascii')}"
+
     def _get(self, url_parsed, timeout=30) -> dict:
-        response = request.get(url_parsed, timeout=timeout)
-        if response.code == 200:
-            return response.json()
-        raise ConnectionRefusedError(response.data)
+        return _cached_get(url_parsed, timeout=timeout)
 
     def _get_share_info(self):
 
         try:
             # Fetches and processes the share information from the API
             query = {"language": self.language, "pageNumber": 1, "pageSize": 20, "company": self.trading_code}
-            query_encoded = base64_encode(query).decode()
-            url = f"{self.config['base_api_url']}/{self.config['regist_info_endpoint']}/{query_encoded}"
+            url = self._url('regist_info_endpoint', query)
             response = self._get(url)
             results = response.get("results", [])
 
@@ -81,18 +136,13 @@ class Share:
                 'agency':         self.market_indicator,
                 'dateInitial':    '2024-05-02',
                 'dateFinal':      '2024-06-01',
-                'issuingCompany': ''.join(char for char in self.trading_code if not char.isnumeric())
+                'issuingCompany': self.trading_code.translate(_STRIP_DIGITS)
             }
-            query_encoded = base64_encode(query).decode()
-            url = f"{self.config['base_api_url']}/{self.config['head_lines_endpoint']}/{query_encoded}"
+            url = self._url('head_lines_endpoint', query)
             response = self._get(url)
-            self._head_lines = []
-            for headline in response:
-                self._head_lines.append({
-                    "headline": headline["headline"],
-                    "date":     headline["dateTime"],
-                    "url":      headline["url"]
-                })
+            self._head_lines = [{"headline": headline["headline"],
+                                 "date":     headline["dateTime"],
+                                 "url":      headline["url"]} for headline in response]
 
         except Exception as err:
             raise Exception(f"Erro ao processar dados de eventos. {err}")
@@ -102,8 +152,7 @@ class Share:
             # Fetches and processes the headlines related to the share from the API
             query = {"codeCVM":  self.code_cvm,
                      "language": "pt-br"}
-            query_encoded = base64_encode(query).decode()
-            url = f"{self.config['base_api_url']}/{self.config['financial_endpoint']}/{query_encoded}"
+            url = self._url('financial_endpoint', query)
             response = self._get(url)
             if response:
                 self._financial = FinancialData(
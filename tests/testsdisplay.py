@@ -0,0 +1,225 @@
+import sys
+import time
+import unittest
+import weakref
+from unittest import mock
+
+from cereja.display import _display
+
+
+class StdoutCaptureTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stdout = _display._Stdout(_display.console)
+        self.written = []
+        self.stdout._write = self.written.append  # keeps the console output out of the test run
+        self.addCleanup(self.stdout.disable)
+
+    def test_no_thread_without_user_writes(self):
+        self.stdout.persist()
+        self.assertIs(sys.stdout, self.stdout._stdout_redirect)
+        self.assertIs(sys.stderr, self.stdout._stderr_redirect)
+        self.assertFalse(self.stdout.use_th_console)
+        self.assertIsNone(self.stdout.th_console)
+        self.stdout.disable()
+        self.assertIsNone(self.stdout.th_console)
+        self.assertEqual(self.written, [])
+
+    def test_first_write_starts_consumer(self):
+        self.stdout.persist()
+        print("cereja")
+        self.assertIs(sys.stdout, self.stdout._stdout_buffer)
+        self.assertTrue(self.stdout.use_th_console)
+        th_console = self.stdout.th_console
+        self.assertTrue(th_console.is_alive())
+        self.stdout.disable()
+        self.assertFalse(th_console.is_alive())
+        self.assertTrue(any("cereja" in msg for msg in self.written))
+
+    def test_restored_after_disable(self):
+        self.stdout.persist()
+        redirect = self.stdout._stdout_redirect
+        print("cereja")
+        self.stdout.disable()
+        self.assertIs(sys.stdout, _display._STDOUT_ORIGINAL_COPY)
+        self.assertIs(sys.stderr, _display._STDERR_ORIGINAL_COPY)
+        self.assertFalse(self.stdout.persisting)
+        # a reference kept after disable writes to the original stream
+        self.assertIs(redirect._get_target(), self.stdout._stdout_original)
+
+    def test_flush_after_disable(self):
+        self.stdout.persist()
+        redirect = self.stdout._stdout_redirect
+        with mock.patch.object(self.stdout._stdout_original, "flush") as flush:
+            redirect.flush()
+            flush.assert_not_called()
+            self.stdout.disable()
+            redirect.flush()
+            flush.assert_called_once_with()
+
+
+class ConsoleTemplateFormatTest(unittest.TestCase):
+    def test_default_color_after_reinit(self):
+        console = _display.console
+        stdout = console._stdout
+        # a real _Stdout left for the gc would restore sys.stdout from __del__ during another test
+        with mock.patch.object(_display, "_Stdout"):
+            self.assertIs(_display._ConsoleBase(), console)  # __init__ runs again on the singleton
+        self.addCleanup(setattr, console, "_stdout", stdout)
+        self.addCleanup(setattr, console, "text_color", "default")
+        console.template_format("{red}x{endred}")
+        console.text_color = "green"
+        result = console.template_format("{red}x{endred}")
+        self.assertTrue(result.endswith(console.CL_GREEN))
+        self.assertEqual(result, f"{console.CL_RED}x{console.CL_GREEN}{console.CL_GREEN}")
+
+
+class ConsoleMsgPrefixTest(unittest.TestCase):
+    def test_prefix_follows_name(self):
+        console = _display.console
+        name = console.prefix_name
+        self.addCleanup(console.set_prefix, name)
+        console.set_prefix("cereja")
+        self.assertIn(" cereja ", console._msg_prefix())
+        console.set_prefix("cherry")
+        self.assertIn(" cherry ", console._msg_prefix())
+        self.assertIs(console._msg_prefix("cereja"), console._msg_prefix("cereja"))
+
+    def test_cache_is_bounded(self):
+        console = _display.console
+        for idx in range(500):
+            console._msg_prefix(f"title-{idx}")
+        self.assertLessEqual(console._title_prefix.cache_info().currsize, 128)
+
+
+class NonBmpMapTest(unittest.TestCase):
+    def test_translate(self):
+        non_bmp_map = _display._NonBmpMap()
+        self.assertEqual("a\U0001F352b".translate(non_bmp_map), "a\ufffdb")
+        self.assertEqual("\u00e7\uffff".translate(non_bmp_map), "\u00e7\uffff")  # BMP is kept
+        self.assertRaises(LookupError, non_bmp_map.__getitem__, 0xFFFF)
+        self.assertEqual(non_bmp_map[0x10000], 0xFFFD)
+
+
+class StatePercentTest(unittest.TestCase):
+    def test_display(self):
+        state = _display._StatePercent()
+        self.assertEqual(state.display(5.25, 100, 5.25, 0, 1), "005.25%")
+        self.assertEqual(state.display(50, 100, 50.0, 0, 1), "050.00%")
+        self.assertEqual(state.display(5.25, 100, 5.25, 0, 2), "005.25%")  # memoized value
+        self.assertEqual(state.done(100, 100, 100.0, 0, 1), "100.00%")
+
+    def test_cache_bounded(self):
+        state = _display._StatePercent()
+        self.assertEqual(state.display(15, 10, 150.0, 0, 1), "150.00%")
+        self.assertEqual(state.display(-1, 10, -10.0, 0, 1), "-10.00%")
+        self.assertEqual(len(state._cache), 0)
+
+    def test_progress_percent(self):
+        # max_value == 100 takes the value as the percentage
+        self.assertEqual(_display.Progress._percent(5.25, 100), 5.25)
+        self.assertEqual(_display.Progress._percent(1, 3), 33.33)
+
+
+class StateTimeTest(unittest.TestCase):
+    def test_nan_estimate_not_reused(self):
+        state = _display._StateTime()
+        self.assertIn("nan", state.display(0, 10, 0.0, 0.0, 1))
+        # inside the reuse window, but nothing was estimated yet
+        self.assertNotIn("nan", state.display(5, 10, 50.0, 0.1, 2))
+        self.assertEqual(state._estimate_at, 0.1)
+
+    def test_estimate_reused_inside_interval(self):
+        state = _display._StateTime()
+        state.display(5, 10, 50.0, 1.0, 1)
+        estimate = state._estimate
+        state.display(9, 10, 90.0, 1.1, 2)
+        self.assertEqual(state._estimate_at, 1.0)
+        self.assertIs(state._estimate, estimate)
+        state.display(9, 10, 90.0, 1.5, 3)
+        self.assertEqual(state._estimate_at, 1.5)
+
+
+class ProgressOutputTestCase(unittest.TestCase):
+    """
+    Captures the console writes of the progress.
+    """
+
+    def setUp(self) -> None:
+        self.written = []
+        patcher = mock.patch.object(_display.console._stdout, "_write", self.written.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _progress(is_tty, **kwargs):
+        with mock.patch.object(_display, "_is_interactive", return_value=is_tty):
+            return _display.Progress(name="cereja", **kwargs)
+
+
+class ProgressFinalFrameTest(ProgressOutputTestCase):
+    def _final_frames(self):
+        return [msg for msg in self.written if msg.endswith("\n")]
+
+    def test_single_final_frame(self):
+        # a loop finishing during the awaiting phase writes the final frame only once
+        progress = self._progress(is_tty=True)
+        for _ in progress(range(50)):
+            time.sleep(0.005)
+        self.assertEqual(len(self._final_frames()), 1)
+
+
+class ProgressNotInteractiveTest(ProgressOutputTestCase):
+    def test_no_threads(self):
+        progress = self._progress(is_tty=False)
+        for _ in progress(range(5)):
+            self.assertFalse(progress._th_root.is_alive())
+            self.assertFalse(_display.console._stdout.persisting)
+            self.assertFalse(_display.console._stdout.use_th_console)
+        self.assertTrue(progress._was_done)
+        self.assertEqual(len(self.written), 1)  # only the final state
+
+
+class ProgressNewIterationTest(ProgressOutputTestCase):
+    def test_state_reset_between_passes(self):
+        progress = self._progress(is_tty=False)
+        with progress:
+            for n in progress(range(10)):
+                if n == 3:
+                    break
+            self.assertTrue(progress._err)
+            self.assertFalse(progress._was_done)
+            for _ in progress(range(5)):
+                pass
+            self.assertTrue(progress._was_done)
+            self.assertFalse(progress._err)
+
+
+class ProgressCustomStateTest(unittest.TestCase):
+    def test_keyword_arguments(self):
+        class KwState(_display.State):
+            def display(self, current_percent, **kwargs):
+                return f"kw {current_percent}"
+
+            def done(self, n_times, current_value, **kwargs):
+                return f"done {current_value}"
+
+        progress = _display.Progress(name="cereja", max_value=10, states=(KwState,))
+        self.assertEqual(progress._states_view(5), "kw 50.0")
+        progress._current_value = 10
+        progress._was_done = True
+        self.assertTrue(progress._states_view(10).startswith("done 10 - "))
+
+
+class ProgressSlotsTest(unittest.TestCase):
+    def test_weakref(self):
+        progress = _display.Progress(name="cereja")
+        self.assertIs(weakref.ref(progress)(), progress)
+
+    def test_state_bar_override(self):
+        state = _display._StateBar()
+        state.default_char = "#"
+        self.assertEqual(state.default_char, "#")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import time
+import unittest
+from unittest import mock
+
+from cereja.hashtools import base64_decode
+from cereja.scraping import b3
+
+
+class _FakeResponse:
+    def __init__(self, data, code=200):
+        self.code = code
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def _fake_share_info(url, timeout=30):
+    query = base64_decode(url.rsplit("/", 1)[-1], eval_str=True)
+    if query["company"] == "PETR4":
+        time.sleep(0.05)  # first code finishes last
+    return _FakeResponse({"results": [{"codeCVM":         1,
+                                       "companyName":     query["company"],
+                                       "cnpj":            "123",
+                                       "segment":         "",
+                                       "marketIndicator": "",
+                                       "typeBDR":         "",
+                                       "dateListing":     ""}]})
+
+
+class ShareTest(unittest.TestCase):
+    def setUp(self) -> None:
+        b3.Share.clear_cache()
+
+    def test_from_trading_codes(self):
+        with mock.patch.object(b3.request, "get", side_effect=_fake_share_info) as get:
+            shares = b3.Share.from_trading_codes(["petr4", "VALE3", "ITUB4"])
+        self.assertEqual([share.name for share in shares], ["PETR4", "VALE3", "ITUB4"])
+        self.assertEqual([share.trading_code for share in shares], ["PETR4", "VALE3", "ITUB4"])
+        self.assertEqual(get.call_count, 3)
+
+    def test_from_trading_codes_empty(self):
+        with mock.patch.object(b3.request, "get") as get:
+            self.assertEqual(b3.Share.from_trading_codes([]), [])
+            self.assertEqual(b3.Share.from_trading_codes(iter(())), [])
+        get.assert_not_called()
+
+
+class CachedGetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        b3.Share.clear_cache()
+        self.now = 1000.0
+        patcher = mock.patch.object(b3, "time")
+        self.addCleanup(patcher.stop)
+        patcher.start().time.side_effect = lambda: self.now
+
+    def tearDown(self) -> None:
+        b3.Share.clear_cache()
+
+    def test_cached_within_ttl(self):
+        with mock.patch.object(b3.request, "get", return_value=_FakeResponse({"a": 1})) as get:
+            self.assertEqual(b3._cached_get("url"), {"a": 1})
+            self.now += b3._RESPONSE_CACHE_TTL - 1
+            self.assertEqual(b3._cached_get("url"), {"a": 1})
+        self.assertEqual(get.call_count, 1)
+
+    def test_expired_after_ttl(self):
+        with mock.patch.object(b3.request, "get", side_effect=[_FakeResponse({"a": 1}),
+                                                               _FakeResponse({"a": 2})]) as get:
+            self.assertEqual(b3._cached_get("url"), {"a": 1})
+            self.now += b3._RESPONSE_CACHE_TTL
+            self.assertEqual(b3._cached_get("url"), {"a": 2})
+        self.assertEqual(get.call_count, 2)
+
+    def test_error_is_not_cached(self):
+        with mock.patch.object(b3.request, "get", side_effect=[_FakeResponse("error", code=500),
+                                                               _FakeResponse({"a": 1})]) as get:
+            self.assertRaises(ConnectionRefusedError, b3._cached_get, "url")
+            self.assertEqual(b3._cached_get("url"), {"a": 1})
+        self.assertEqual(get.call_count, 2)
+
+    def test_evicts_oldest(self):
+        with mock.patch.object(b3, "_RESPONSE_CACHE_MAX_SIZE", 2), \
+                mock.patch.object(b3.request, "get", side_effect=lambda url, timeout: _FakeResponse(url)):
+            for url in ("a", "b", "c"):
+                b3._cached_get(url)
+        self.assertEqual(list(b3._response_cache), ["b", "c"])
+
+    def test_clear_cache(self):
+        with mock.patch.object(b3.request, "get", return_value=_FakeResponse({"a": 1})) as get:
+            b3._cached_get("url")
+            b3.Share.clear_cache()
+            b3._cached_get("url")
+        self.assertEqual(get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()